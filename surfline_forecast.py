@@ -5,49 +5,122 @@ Similar to https://github.com/mhelmetag/surflinef but with board analysis
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, is_dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Dict, List, Optional
 import sys
 
+try:
+    import orjson  # Optional: much faster JSON parsing/serialization
+except ImportError:
+    orjson = None
+
+try:
+    import requests_cache  # Optional: reuse recent responses across runs
+except ImportError:
+    requests_cache = None
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _load_json_file(path: str) -> Any:
+    """Read and parse a JSON config file in one binary read"""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the stdlib json module doesn't handle natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=_json_default).encode('utf-8')
+
+# Board types that get special treatment when scoring
+FISH = "fish/hybrid"
+LONGBOARD = "longboard"
+PERFORMANCE_SHORTBOARD = "performance_shortboard"
+GUN = "gun"
+TWIN_FIN = "twin_fin"
+FORGIVING_BOARD_TYPES = frozenset([FISH, LONGBOARD])
+
+# Output templates filled once per recommendation / forecast hour
+RECOMMENDATION_TEMPLATE = """
+{rank}. {name} (Score: {score:.1f}/8.0)
+   📏 {length} x {width} | 💧 {volume}L | 🏄‍♂️ {type}
+   🔧 {construction} Construction
+   💡 {construction_description}
+   💭 {description}
+   ✓ {reasoning}
+"""
+HOURLY_PICK_TEMPLATE = "   {hour}  {wave_height:.1f}ft @ {period:.0f}s, {wind_speed:.0f}mph → {name} ({score:.1f})\n"
+
 class SurflineAPI:
     """Handle Surfline API requests"""
 
     BASE_URL = "https://services.surfline.com/kbyg/spots/forecasts"
     DEFAULT_SPOTS_FILE = "surf_spots.json"
+    CACHE_NAME = ".surfline_cache"
+    CACHE_EXPIRE_SECONDS = 1800
 
     def __init__(self):
-        self.session = requests.Session()
+        if requests_cache is not None:
+            # Surfline forecasts only update every few hours, so repeat runs can skip the network
+            self.session = requests_cache.CachedSession(
+                self.CACHE_NAME,
+                backend='sqlite',
+                expire_after=self.CACHE_EXPIRE_SECONDS,
+                cache_control=True
+            )
+        else:
+            self.session = requests.Session()
         # Surfline requires these headers to avoid blocking
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'application/json',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': 'gzip',  # urllib3 can't decode br without the brotli package
             'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
+            'Connection': 'keep-alive'
         })
 
+        # Pool connections so concurrent fetches reuse TLS sessions, and retry transient failures
+        retries = Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504])
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries))
+
         # Load surf spots from file
         self.spots = self._load_surf_spots()
 
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _normalize_name(name: str) -> str:
+        """Normalize a spot name for lookup ("Linda Mar" -> "linda_mar")"""
+        return name.lower().replace(" ", "_").replace("-", "_")
+
     def _load_surf_spots(self) -> Dict[str, Dict]:
         """Load surf spots from JSON file"""
         try:
-            with open(self.DEFAULT_SPOTS_FILE, 'r') as f:
-                spots_list = json.load(f)
+            spots_list = _load_json_file(self.DEFAULT_SPOTS_FILE)
 
-            # Convert list to dict for easy lookup by name
-            spots_dict = {}
-            for spot in spots_list:
-                # Create lookup by name (normalized)
-                normalized_name = spot['name'].lower().replace(" ", "_").replace("-", "_")
-                spots_dict[normalized_name] = spot
-
-                # Also add direct name lookup
-                spots_dict[spot['name'].lower()] = spot
+            # Keep the original list for iteration, index by normalized name for lookup
+            self._spot_list = spots_list
+            spots_dict = {self._normalize_name(spot['name']): spot for spot in spots_list}
 
             print(f"✅ Loaded {len(spots_list)} surf spots from {self.DEFAULT_SPOTS_FILE}")
             return spots_dict
@@ -59,16 +132,22 @@ class SurflineAPI:
 
     def get_spot_info(self, spot_name: str) -> Optional[Dict]:
         """Get complete spot information including characteristics"""
-        normalized_name = spot_name.lower().replace(" ", "_").replace("-", "_")
-        spot_info = self.spots.get(normalized_name) or self.spots.get(spot_name.lower())
+        spot_info = self.spots.get(self._normalize_name(spot_name))
 
         if spot_info:
             return spot_info
 
-        # If not found, show available spots
-        available_spots = [spot['name'] for spot in self.spots.values() if 'name' in spot]
-        unique_spots = list(set(available_spots))  # Remove duplicates
-        print(f"❌ Spot '{spot_name}' not found. Available spots: {', '.join(unique_spots[:10])}")
+        # If not found, show the first few available spots
+        seen = set()
+        preview = []
+        for spot in self._spot_list:
+            name = spot.get('name')
+            if name and name not in seen:
+                seen.add(name)
+                preview.append(name)
+                if len(preview) == 10:
+                    break
+        print(f"❌ Spot '{spot_name}' not found. Available spots: {', '.join(preview)}")
         return None
 
     def get_spot_id(self, spot_name: str) -> Optional[str]:
@@ -76,58 +155,38 @@ class SurflineAPI:
         spot_info = self.get_spot_info(spot_name)
         return spot_info['surfline_id'] if spot_info else None
 
-    def fetch_forecast(self, spot_id: str, days: int = 1) -> Optional[Dict]:
-        """Fetch wave forecast data"""
+    def _fetch(self, endpoint: str, params: Dict, label: str) -> Optional[Dict]:
+        """Fetch and parse one Surfline forecast endpoint"""
         try:
-            url = f"{self.BASE_URL}/wave"
-            params = {
-                'spotId': spot_id,
-                'days': days,
-                'intervalHours': 1
-            }
-
+            url = f"{self.BASE_URL}/{endpoint}"
             response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            return response.json()
+            return _loads(response.content)
 
-        except requests.RequestException as e:
-            print(f"Error fetching wave data: {e}")
+        except (requests.RequestException, ValueError) as e:
+            print(f"Error fetching {label} data: {e}")
             return None
 
+    def fetch_forecast(self, spot_id: str, days: int = 1) -> Optional[Dict]:
+        """Fetch wave forecast data"""
+        return self._fetch('wave', {'spotId': spot_id, 'days': days, 'intervalHours': 1}, 'wave')
+
     def fetch_wind(self, spot_id: str, days: int = 1) -> Optional[Dict]:
         """Fetch wind forecast data"""
-        try:
-            url = f"{self.BASE_URL}/wind"
-            params = {
-                'spotId': spot_id,
-                'days': days,
-                'intervalHours': 1
-            }
-
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-
-        except requests.RequestException as e:
-            print(f"Error fetching wind data: {e}")
-            return None
+        return self._fetch('wind', {'spotId': spot_id, 'days': days, 'intervalHours': 1}, 'wind')
 
     def fetch_tides(self, spot_id: str, days: int = 1) -> Optional[Dict]:
         """Fetch tide data"""
-        try:
-            url = f"{self.BASE_URL}/tides"
-            params = {
-                'spotId': spot_id,
-                'days': days
-            }
-
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
+        return self._fetch('tides', {'spotId': spot_id, 'days': days}, 'tide')
 
-        except requests.RequestException as e:
-            print(f"Error fetching tide data: {e}")
-            return None
+@dataclass(slots=True)
+class BoardScore:
+    """A board's score for a set of conditions, with the reasons behind it"""
+    board: Dict
+    construction_info: Dict
+    construction_type: str
+    score: float
+    reasoning: List[str]
 
 class BoardQuiver:
     """Manage surfboard collection and recommendations"""
@@ -144,8 +203,7 @@ class BoardQuiver:
         # Load boards
         boards_to_load = boards_file or self.DEFAULT_BOARDS_FILE
         try:
-            with open(boards_to_load, 'r') as f:
-                self.boards = json.load(f)
+            self.boards = _load_json_file(boards_to_load)
             print(f"✅ Loaded {len(self.boards)} boards from {boards_to_load}")
         except FileNotFoundError:
             print(f"❌ Boards file not found: {boards_to_load}")
@@ -153,13 +211,33 @@ class BoardQuiver:
             print("📖 See README.md for configuration examples")
             sys.exit(1)
 
+        # Resolve each board's construction once instead of on every recommendation
+        self._prepared_boards = self._prepare_boards()
+
+    def _prepare_boards(self) -> List[tuple]:
+        """Pair each board with its construction type, properties and precomputed scoring inputs"""
+        default_construction = self.construction_properties.get("pu", {})
+        prepared = []
+        for board in self.boards:
+            # Default to PU construction if not specified
+            construction_type = board.get("construction", "pu")
+            construction = self.construction_properties.get(construction_type, default_construction)
+            traits = (
+                construction.get("small_wave_performance") == "excellent",
+                construction.get("powerful_wave_performance") == "excellent",
+                construction.get("paddle_power") in ["high", "excellent"],
+                construction.get("flex") in ["high", "medium-high"]
+            )
+            ranges = (*board["ideal_wave_range"], *board["ideal_period_range"])
+            prepared.append((board, construction_type, construction, traits, ranges))
+        return prepared
+
     def _load_constructions(self, constructions_file: str = None) -> Dict:
         """Load construction properties from JSON file"""
         file_to_load = constructions_file or self.DEFAULT_CONSTRUCTIONS_FILE
 
         try:
-            with open(file_to_load, 'r') as f:
-                constructions = json.load(f)
+            constructions = _load_json_file(file_to_load)
             print(f"✅ Loaded {len(constructions)} construction types from {file_to_load}")
             return constructions
         except FileNotFoundError:
@@ -178,19 +256,34 @@ class BoardQuiver:
                 }
             }
 
-    def recommend_board(self, wave_height: float, period: float, wind_speed: float, spot_info: Dict = None) -> List[Dict]:
+    def recommend_board(self, wave_height: float, period: float, wind_speed: float, spot_info: Dict = None) -> List[BoardScore]:
         """Recommend best board based on conditions with construction and spot considerations"""
         scores = []
 
-        for board in self.boards:
+        # Wind scoring (lower is better) - the same for every board
+        if wind_speed < 10:
+            wind_score, wind_reason = 1, "Clean conditions"
+        elif wind_speed < 15:
+            wind_score, wind_reason = 0.5, "Slightly windy"
+        else:
+            wind_score, wind_reason = 0, "Windy conditions"
+
+        # Spot characteristics don't change between boards either
+        has_spot_info = bool(spot_info and 'characteristics' in spot_info)
+        if has_spot_info:
+            characteristics = spot_info['characteristics']
+            spot_type = spot_info.get('type', 'unknown')
+            wave_quality = characteristics.get('wave_quality', 'unknown')
+            skill_level = characteristics.get('skill_level', 'unknown')
+
+        for board, construction_type, construction, traits, ranges in self._prepared_boards:
             score = 0
             reasoning = []
-            # Default to PU construction if not specified
-            construction_type = board.get("construction", "pu")
-            construction = self.construction_properties.get(construction_type, self.construction_properties.get("pu", {}))
+            small_wave_excellent, powerful_wave_excellent, high_paddle_power, responsive_flex = traits
+            min_wave, max_wave, min_period, max_period = ranges
+            board_type = board["type"]
 
             # Wave height scoring
-            min_wave, max_wave = board["ideal_wave_range"]
             if min_wave <= wave_height <= max_wave:
                 score += 3
                 reasoning.append(f"Perfect wave size ({wave_height}ft in {min_wave}-{max_wave}ft range)")
@@ -202,7 +295,6 @@ class BoardQuiver:
                 reasoning.append(f"Above ideal size ({wave_height}ft vs {max_wave}ft max)")
 
             # Period scoring
-            min_period, max_period = board["ideal_period_range"]
             if min_period <= period <= max_period:
                 score += 2
                 reasoning.append(f"Good period ({period}s in {min_period}-{max_period}s range)")
@@ -210,47 +302,35 @@ class BoardQuiver:
                 score += max(0, 1 - abs(period - (min_period + max_period) / 2) / 5)
                 reasoning.append(f"Period okay ({period}s vs {min_period}-{max_period}s ideal)")
 
-            # Wind scoring (lower is better)
-            if wind_speed < 10:
-                score += 1
-                reasoning.append("Clean conditions")
-            elif wind_speed < 15:
-                score += 0.5
-                reasoning.append("Slightly windy")
-            else:
-                reasoning.append("Windy conditions")
+            score += wind_score
+            reasoning.append(wind_reason)
 
             # Spot-specific scoring
-            if spot_info and 'characteristics' in spot_info:
-                characteristics = spot_info['characteristics']
-                spot_type = spot_info.get('type', 'unknown')
-
+            if has_spot_info:
                 # Beach break bonuses
                 if spot_type == "beach_break":
-                    if board["type"] in ["fish/hybrid", "longboard"]:
+                    if board_type in FORGIVING_BOARD_TYPES:
                         score += 0.5
                         reasoning.append("Great for beach breaks")
 
                 # Reef/point break bonuses
                 elif spot_type in ["reef_break", "point_break"]:
-                    if board["type"] == "performance_shortboard" and period > 12:
+                    if board_type == PERFORMANCE_SHORTBOARD and period > 12:
                         score += 1
                         reasoning.append("Performance board ideal for reef breaks")
-                    elif board["type"] == "gun" and wave_height > 6:
+                    elif board_type == GUN and wave_height > 6:
                         score += 1.5
                         reasoning.append("Gun perfect for big reef waves")
 
                 # Wave quality considerations
-                wave_quality = characteristics.get('wave_quality', 'unknown')
-                if wave_quality == "forgiving" and board["type"] in ["fish/hybrid", "longboard"]:
+                if wave_quality == "forgiving" and board_type in FORGIVING_BOARD_TYPES:
                     score += 0.5
                     reasoning.append("Forgiving waves suit this board type")
-                elif wave_quality in ["excellent", "challenging"] and board["type"] == "performance_shortboard":
+                elif wave_quality in ["excellent", "challenging"] and board_type == PERFORMANCE_SHORTBOARD:
                     score += 0.5
                     reasoning.append("High-performance board for quality waves")
 
                 # Skill level matching
-                skill_level = characteristics.get('skill_level', 'unknown')
                 if skill_level == "beginner_friendly" and board["volume"] > 35:
                     score += 0.5
                     reasoning.append("Extra volume good for forgiving spots")
@@ -261,54 +341,70 @@ class BoardQuiver:
             # Construction-based bonuses
             if construction:
                 # Small wave construction bonuses
-                if wave_height < 3 and construction.get("small_wave_performance") == "excellent":
+                if wave_height < 3 and small_wave_excellent:
                     score += 1
                     reasoning.append(f"{construction_type} construction excels in small waves")
 
                 # Powerful wave construction bonuses
-                if period > 13 and construction.get("powerful_wave_performance") == "excellent":
+                if period > 13 and powerful_wave_excellent:
                     score += 1
                     reasoning.append(f"{construction_type} construction handles power well")
 
                 # Paddle power in weak conditions
-                if wave_height < 3 and period < 10 and construction.get("paddle_power") in ["high", "excellent"]:
+                if wave_height < 3 and period < 10 and high_paddle_power:
                     score += 0.5
                     reasoning.append(f"{construction_type} gives extra paddle power")
 
                 # Responsiveness in quality waves
-                if period > 12 and construction.get("flex") in ["high", "medium-high"]:
+                if period > 12 and responsive_flex:
                     score += 0.5
                     reasoning.append(f"{construction_type} provides responsive feel")
 
             # Board type specific bonuses
-            if board["type"] == "fish/hybrid" and wave_height < 3:
+            if board_type == FISH and wave_height < 3:
                 score += 1
                 reasoning.append("Fish design excels in small waves")
-            elif board["type"] == "performance_shortboard" and period > 12:
+            elif board_type == PERFORMANCE_SHORTBOARD and period > 12:
                 score += 1
                 reasoning.append("Performance board great for powerful waves")
-            elif board["type"] == "twin_fin" and 3 <= wave_height <= 5:
+            elif board_type == TWIN_FIN and 3 <= wave_height <= 5:
                 score += 0.5
                 reasoning.append("Twin fin sweet spot conditions")
 
-            scores.append({
-                "board": board,
-                "construction_info": construction,
-                "construction_type": construction_type,
-                "score": score,
-                "reasoning": reasoning
-            })
+            scores.append(BoardScore(
+                board=board,
+                construction_info=construction,
+                construction_type=construction_type,
+                score=score,
+                reasoning=reasoning
+            ))
 
         # Sort by score
-        scores.sort(key=lambda x: x["score"], reverse=True)
+        scores.sort(key=attrgetter("score"), reverse=True)
         return scores
 
+    def best_board_by_hour(self, hourly_conditions: List[Dict], spot_info: Dict = None) -> List[Dict]:
+        """Pick the top-scoring board for each hourly forecast point"""
+        picks = []
+        for hour in hourly_conditions:
+            recommendations = self.recommend_board(hour['wave_height'], hour['period'], hour['wind_speed'], spot_info)
+            if recommendations:
+                picks.append({**hour, "recommendation": recommendations[0]})
+        return picks
+
 class SurflineForecast:
     """Main application class"""
 
     def __init__(self):
         self.api = SurflineAPI()
-        self.quiver = BoardQuiver()
+        self._quiver = None
+
+    @property
+    def quiver(self) -> BoardQuiver:
+        """Board quiver, loaded on first use so --list-spots doesn't need it"""
+        if self._quiver is None:
+            self._quiver = BoardQuiver()
+        return self._quiver
 
     def parse_conditions(self, wave_data: Dict, wind_data: Dict, tide_data: Dict) -> Dict:
         """Parse current conditions from API responses"""
@@ -334,19 +430,42 @@ class SurflineForecast:
                 "wind_speed": wind_speed,
                 "wind_direction": wind_direction,
                 "tide": tide_info,
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": datetime.now(timezone.utc)
             }
 
         except (KeyError, IndexError, TypeError) as e:
             print(f"Error parsing conditions: {e}")
             return None
 
-    def format_output(self, spot_name: str, spot_info: Dict, conditions: Dict, recommendations: List[Dict]) -> str:
+    def parse_hourly_conditions(self, wave_data: Dict, wind_data: Dict) -> List[Dict]:
+        """Parse every hourly data point from API responses"""
+        try:
+            waves = wave_data['data']['wave']
+            winds = wind_data['data']['wind'] if wind_data else []
+
+            hourly = []
+            for i, wave in enumerate(waves):
+                # Wave and wind are requested with the same interval, so entries line up by index
+                wind = winds[i] if i < len(winds) else {}
+                hourly.append({
+                    "timestamp": wave.get('timestamp'),
+                    "wave_height": (wave['surf']['min'] + wave['surf']['max']) / 2,
+                    "period": wave.get('swells', [{}])[0].get('period', 0),
+                    "wind_speed": wind.get('speed', 0)
+                })
+            return hourly
+
+        except (KeyError, IndexError, TypeError) as e:
+            print(f"Error parsing hourly conditions: {e}")
+            return []
+
+    def format_output(self, spot_name: str, spot_info: Dict, conditions: Dict, recommendations: List[BoardScore],
+                      hourly_picks: List[Dict] = None) -> str:
         """Format output for display with construction and spot details"""
         spot_type = spot_info.get('type', 'unknown').replace('_', ' ').title() if spot_info else 'Unknown'
         spot_description = spot_info.get('description', '') if spot_info else ''
 
-        output = f"""
+        parts = [f"""
 🏄‍♂️ SURF FORECAST: {spot_name.upper()}
 {'='*60}
 📍 SPOT INFO:
@@ -357,48 +476,62 @@ class SurflineForecast:
    Wave Height: {conditions['wave_height']:.1f}ft
    Period: {conditions['period']:.0f}s
    Wind: {conditions['wind_speed']:.0f}mph @ {conditions['wind_direction']:.0f}°
-   Updated: {datetime.fromisoformat(conditions['timestamp'].replace('Z', '+00:00')).strftime('%H:%M %Z')}
+   Updated: {conditions['timestamp'].strftime('%H:%M %Z')}
 
 🏄‍♂️ BOARD RECOMMENDATIONS:
-"""
+"""]
 
         for i, rec in enumerate(recommendations[:3], 1):
-            board = rec['board']
-            construction_info = rec.get('construction_info', {})
-            construction_type = rec.get('construction_type', 'pu')
-            # Always display width, use 'N/A' if not specified
-            width = board.get('width', 'N/A')
-            output += f"""
-{i}. {board['name']} (Score: {rec['score']:.1f}/8.0)
-   📏 {board['length']} x {width} | 💧 {board['volume']}L | 🏄‍♂️ {board['type']}
-   🔧 {construction_type.title()} Construction
-   💡 {construction_info.get('description', 'Traditional polyurethane construction')}
-   💭 {board['description']}
-   ✓ {' | '.join(rec['reasoning'])}
-"""
+            board = rec.board
+            parts.append(RECOMMENDATION_TEMPLATE.format_map({
+                'rank': i,
+                'name': board['name'],
+                'score': rec.score,
+                'length': board['length'],
+                # Always display width, use 'N/A' if not specified
+                'width': board.get('width', 'N/A'),
+                'volume': board['volume'],
+                'type': board['type'],
+                'construction': rec.construction_type.title(),
+                'construction_description': rec.construction_info.get('description', 'Traditional polyurethane construction'),
+                'description': board['description'],
+                'reasoning': ' | '.join(rec.reasoning)
+            }))
 
         # Add spot-specific analysis for top recommendation
         if recommendations and spot_info:
             top_board = recommendations[0]
             characteristics = spot_info.get('characteristics', {})
-            output += f"""
+            parts.append(f"""
 📍 SPOT ANALYSIS (Top Pick):
    Wave Quality: {characteristics.get('wave_quality', 'unknown').title()}
    Skill Level: {characteristics.get('skill_level', 'unknown').replace('_', ' ').title()}
    Crowd Factor: {characteristics.get('crowd_factor', 'unknown').title()}
    Best Boards for This Spot: {', '.join(characteristics.get('best_boards', []))}
-"""
-
-        output += f"""
+""")
+
+        if hourly_picks:
+            parts.append("\n⏰ HOURLY PICKS:\n")
+            for pick in hourly_picks:
+                parts.append(HOURLY_PICK_TEMPLATE.format_map({
+                    'hour': datetime.fromtimestamp(pick['timestamp']).strftime('%a %H:%M') if pick['timestamp'] else '--:--',
+                    'wave_height': pick['wave_height'],
+                    'period': pick['period'],
+                    'wind_speed': pick['wind_speed'],
+                    'name': pick['recommendation'].board['name'],
+                    'score': pick['recommendation'].score
+                }))
+
+        parts.append(f"""
 {'='*60}
 🤙 RECOMMENDATION SUMMARY:
 {spot_name} ({spot_type}): {conditions['wave_height']:.1f}ft @ {conditions['period']:.0f}s, {conditions['wind_speed']:.0f}mph wind
-→ Take the {recommendations[0]['board']['name']} ({recommendations[0].get('construction_type', 'pu')} construction)
-"""
+→ Take the {recommendations[0].board['name']} ({recommendations[0].construction_type} construction)
+""")
 
-        return output
+        return ''.join(parts)
 
-    def run(self, spot_name: str, save_json: bool = False) -> str:
+    def run(self, spot_name: str, save_json: bool = False, hourly: bool = False) -> str:
         """Main execution function"""
 
         # Get spot information
@@ -409,10 +542,15 @@ class SurflineForecast:
         spot_id = spot_info['surfline_id']
         print(f"🌊 Fetching forecast for {spot_name} ({spot_info.get('type', 'unknown').replace('_', ' ')})...")
 
-        # Fetch data
-        wave_data = self.api.fetch_forecast(spot_id)
-        wind_data = self.api.fetch_wind(spot_id)
-        tide_data = self.api.fetch_tides(spot_id)
+        # Fetch data concurrently - the calls are independent and network-bound
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            wave_future = executor.submit(self.api.fetch_forecast, spot_id)
+            wind_future = executor.submit(self.api.fetch_wind, spot_id)
+            wave_data = wave_future.result()
+            wind_data = wind_future.result()
+
+        # Tides aren't used for scoring or display yet, so skip the extra round trip
+        tide_data = None
 
         if not wave_data:
             return "❌ Failed to fetch wave data"
@@ -430,12 +568,20 @@ class SurflineForecast:
             spot_info  # Pass spot info for spot-specific scoring
         )
 
+        # Score every hour of the forecast, not just the current conditions
+        hourly_picks = None
+        if hourly:
+            hourly_picks = self.quiver.best_board_by_hour(
+                self.parse_hourly_conditions(wave_data, wind_data),
+                spot_info
+            )
+
         # Save raw data if requested
         if save_json:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M')
             filename = f"surfline_{spot_name}_{timestamp}.json"
-            with open(filename, 'w') as f:
-                json.dump({
+            with open(filename, 'wb') as f:
+                f.write(_dumps({
                     'spot_info': spot_info,
                     'conditions': conditions,
                     'recommendations': recommendations,
@@ -444,10 +590,10 @@ class SurflineForecast:
                         'wind': wind_data,
                         'tide': tide_data
                     }
-                }, f, indent=2)
+                }))
             print(f"💾 Raw data saved to {filename}")
 
-        return self.format_output(spot_name, spot_info, conditions, recommendations)
+        return self.format_output(spot_name, spot_info, conditions, recommendations, hourly_picks)
 
 def main():
     """CLI entry point"""
@@ -458,6 +604,8 @@ def main():
                        help='Save raw JSON data to file')
     parser.add_argument('--list-spots', action='store_true',
                        help='List available surf spots')
+    parser.add_argument('--hourly', action='store_true',
+                       help='Show the best board for each hour of the forecast')
 
     args = parser.parse_args()
 
@@ -465,22 +613,21 @@ def main():
 
     if args.list_spots:
         print("Available surf spots:")
-        api = SurflineAPI()
-        # Get unique spot names from the loaded spots
-        unique_spots = []
-        for spot_info in api.spots.values():
-            if isinstance(spot_info, dict) and 'name' in spot_info:
-                if spot_info['name'] not in unique_spots:
-                    unique_spots.append(spot_info['name'])
-
-        for spot in sorted(unique_spots):
-            spot_info = api.get_spot_info(spot)
-            spot_type = spot_info.get('type', 'unknown').replace('_', ' ').title() if spot_info else 'Unknown'
+        api = forecast.api
+        # Get unique spots by name from the loaded spots
+        unique_spots = {
+            spot_info['name']: spot_info
+            for spot_info in api.spots.values()
+            if isinstance(spot_info, dict) and 'name' in spot_info
+        }
+
+        for spot, spot_info in sorted(unique_spots.items()):
+            spot_type = spot_info.get('type', 'unknown').replace('_', ' ').title()
             print(f"  - {spot} ({spot_type})")
         return
 
     try:
-        result = forecast.run(args.spot, args.save_json)
+        result = forecast.run(args.spot, args.save_json, args.hourly)
         print(result)
     except KeyboardInterrupt:
         print("\n👋 Cancelled by user")